@@ -1,21 +1,38 @@
 #!/usr/bin/python3
-import os, shutil, time
+import os, select, time
 
 username = os.getlogin()
-bootloader_path = f"/media/{username}/SWITCH SD1/bootloader/"
+media_path = f"/media/{username}"
+sd_name = "SWITCH SD1"
+sd_path = f"{media_path}/{sd_name}"
+bootloader_path = f"{sd_path}/bootloader/"
 backup_path = bootloader_path+"hekate_ipl.ini.bak"
 config_path = bootloader_path+"hekate_ipl.ini"
 
+def _sd_ready():
+    return os.path.ismount(sd_path) and os.path.exists(bootloader_path)
+
+def wait_for_bootloader():
+    if _sd_ready():
+        return
+
+    try:
+        mounts = open("/proc/self/mounts")
+    except OSError:
+        # Fall back to polling when the mount table cannot be watched
+        while not _sd_ready():
+            time.sleep(1)
+        return
+
+    with mounts:
+        # The kernel raises POLLPRI on the mount table whenever a filesystem is mounted or
+        # unmounted, so this only wakes for real mount events, even before /media/<user> exists
+        poller = select.poll()
+        poller.register(mounts, select.POLLPRI)
+        while not _sd_ready():
+            poller.poll()
+
 print(bootloader_path)
-while True:
-    if os.path.exists(bootloader_path):
-        # Copy and replace the file
-        if os.path.exists(backup_path) and os.path.exists(config_path):
-            os.remove(config_path)  # Remove the existing destination file
-            shutil.copy2(backup_path, config_path)  # Copy the source file to the destination location
-            os.remove(backup_path)  # Remove the existing destination file
-            break
-        else:
-            break
-    else:
-        time.sleep(1)
+wait_for_bootloader()
+if os.path.exists(backup_path) and os.path.exists(config_path):
+    os.replace(backup_path, config_path)  # Atomically restore the backup over the config
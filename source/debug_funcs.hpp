@@ -4,12 +4,10 @@
 
 void logMessage(const std::string& message) {
     std::time_t currentTime = std::time(nullptr);
-    std::string logEntry = std::asctime(std::localtime(&currentTime));
-    std::size_t lastNonNewline = logEntry.find_last_not_of("\r\n");
-    if (lastNonNewline != std::string::npos) {
-        logEntry.erase(lastNonNewline + 1);
-    }
-    logEntry = "[" + logEntry + "] " + message + "\n";
+    char timestamp[32];
+    // Same layout as asctime, written straight into a stack buffer without the trailing newline
+    std::strftime(timestamp, sizeof(timestamp), "%a %b %e %H:%M:%S %Y", std::localtime(&currentTime));
+    std::string logEntry = std::string("[") + timestamp + "] " + message + "\n";
 
     FILE* file = fopen("sdmc:/config/ultrahand/log.txt", "a");
     if (file != nullptr) {
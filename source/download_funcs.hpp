@@ -1,5 +1,6 @@
 #pragma once
 #include <cstdio>
+#include <unordered_set>
 #include <curl/curl.h>
 #include <zlib.h>
 #include <zzip/zzip.h>
@@ -63,10 +64,15 @@ bool downloadFile(const std::string& url, const std::string& toDestination) {
         logMessage(std::string("Error opening file: ") + destination);
         return false;
     }
+    
+    // Use 128 KB buffers so each write callback and fwrite moves more data at once
+    const long bufferSize = 131072;
+    setvbuf(file, nullptr, _IOFBF, bufferSize);
 
     curl_easy_setopt(curl, CURLOPT_URL, url.c_str());
     curl_easy_setopt(curl, CURLOPT_WRITEFUNCTION, writeCallback);
     curl_easy_setopt(curl, CURLOPT_WRITEDATA, file);
+    curl_easy_setopt(curl, CURLOPT_BUFFERSIZE, bufferSize);
 
     // Set a user agent
     curl_easy_setopt(curl, CURLOPT_USERAGENT, "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36");
@@ -109,6 +115,12 @@ bool unzipFile(const std::string& zipFilePath, const std::string& toDestination)
     }
 
     bool success = true;
+    
+    // Keep the 128 KB copy buffer on the heap rather than the overlay thread's small stack
+    const zzip_ssize_t bufferSize = 131072;
+    std::vector<char> buffer(bufferSize);
+    
+    std::unordered_set<std::string> createdDirectories;
     ZZIP_DIRENT entry;
     while (zzip_dir_read(dir, &entry)) {
         if (entry.d_name[0] == '\0') continue;  // Skip empty entries
@@ -124,26 +136,27 @@ bool unzipFile(const std::string& zipFilePath, const std::string& toDestination)
             directoryPath = extractedFilePath;
         }
         
-        createDirectory(directoryPath);
-        
-        if (isDirectory(directoryPath)) {
-            logMessage("directoryPath: success");
-        } else {
-            logMessage("directoryPath: failure");
+        // Entries share parents, so only create (and check) each directory once
+        if (createdDirectories.insert(directoryPath).second) {
+            createDirectory(directoryPath);
+            
+            if (isDirectory(directoryPath)) {
+                logMessage("directoryPath: success");
+            } else {
+                logMessage("directoryPath: failure");
+            }
+            
+            logMessage(std::string("directoryPath: ") + directoryPath);
         }
-        
-        logMessage(std::string("directoryPath: ") + directoryPath);
 
         ZZIP_FILE* file = zzip_file_open(dir, entry.d_name, 0);
         if (file) {
             FILE* outputFile = fopen(extractedFilePath.c_str(), "wb");
             if (outputFile) {
                 zzip_ssize_t bytesRead;
-                const zzip_ssize_t bufferSize = 131072;
-                char buffer[bufferSize];
 
-                while ((bytesRead = zzip_file_read(file, buffer, bufferSize)) > 0) {
-                    fwrite(buffer, 1, bytesRead, outputFile);
+                while ((bytesRead = zzip_file_read(file, buffer.data(), bufferSize)) > 0) {
+                    fwrite(buffer.data(), 1, bytesRead, outputFile);
                 }
 
                 fclose(outputFile);
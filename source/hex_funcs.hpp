@@ -2,6 +2,7 @@
 #include <string>
 #include <vector>
 #include <algorithm>
+#include <array>
 
 // Hex-editing commands
 std::string asciiToHex(const std::string& asciiStr) {
@@ -60,9 +61,56 @@ std::string decimalToReversedHex(const std::string& decimalStr, int order=2) {
     return reversedHex;
 }
 
+// Lookup table mapping ASCII hex digits to their nibble values (non-hex characters map to 0xFF)
+constexpr std::array<unsigned char, 256> hexNibbleTable = [] {
+    std::array<unsigned char, 256> table{};
+    table.fill(0xFF);
+    for (int i = 0; i < 10; i++) {
+        table['0' + i] = i;
+    }
+    for (int i = 0; i < 6; i++) {
+        table['a' + i] = 10 + i;
+        table['A' + i] = 10 + i;
+    }
+    return table;
+}();
+
+// Returns an empty vector if hexData is empty or contains any non-hex character (including
+// whitespace and "0x" prefixes, which std::stoi used to partially accept)
+std::vector<char> hexToBinary(const std::string& hexData) {
+    std::vector<char> binaryData;
+    binaryData.reserve((hexData.length() + 1) / 2);
+
+    // Fold each pair of hex digits into a byte without allocating substrings
+    for (std::size_t i = 0; i < hexData.length(); i += 2) {
+        unsigned char byte = hexNibbleTable[static_cast<unsigned char>(hexData[i])];
+        if (byte == 0xFF) {
+            return {};
+        }
+        if (i + 1 < hexData.length()) {
+            unsigned char lowNibble = hexNibbleTable[static_cast<unsigned char>(hexData[i + 1])];
+            if (lowNibble == 0xFF) {
+                return {};
+            }
+            byte = (byte << 4) | lowNibble;
+        }
+        binaryData.push_back(static_cast<char>(byte));
+    }
+
+    return binaryData;
+}
+
 std::vector<std::string> findHexDataOffsets(const std::string& filePath, const std::string& hexData) {
     std::vector<std::string> offsets;
 
+    // Convert the hex data string to binary data
+    // Empty or invalid hex data matches nothing, rather than every offset
+    std::vector<char> binaryData = hexToBinary(hexData);
+    if (binaryData.empty()) {
+        //std::cerr << "Invalid hex data." << std::endl;
+        return offsets;
+    }
+
     // Open the file for reading in binary mode
     FILE* file = fopen(filePath.c_str(), "rb");
     if (!file) {
@@ -79,14 +127,6 @@ std::vector<std::string> findHexDataOffsets(const std::string& filePath, const s
     }
     //std::size_t fileSize = fileStatus.st_size;
 
-    // Convert the hex data string to binary data
-    std::vector<char> binaryData;
-    for (std::size_t i = 0; i < hexData.length(); i += 2) {
-        std::string byteString = hexData.substr(i, 2);
-        char byte = static_cast<char>(std::stoi(byteString, nullptr, 16));
-        binaryData.push_back(byte);
-    }
-
     // Read the file in chunks to find the offsets where the hex data is located
     const std::size_t bufferSize = 1024;
     std::vector<char> buffer(bufferSize);
@@ -110,6 +150,13 @@ void hexEditByOffset(const std::string& filePath, const std::string& offsetStr,
     // Convert the offset string to std::streampos
     std::streampos offset = std::stoll(offsetStr);
 
+    // Convert the hex data string to binary data
+    std::vector<char> binaryData = hexToBinary(hexData);
+    if (binaryData.empty()) {
+        //logMessage("Invalid hex data.");
+        return;
+    }
+
     // Open the file for reading and writing in binary mode
     FILE* file = fopen(filePath.c_str(), "rb+");
     if (!file) {
@@ -124,14 +171,6 @@ void hexEditByOffset(const std::string& filePath, const std::string& offsetStr,
         return;
     }
 
-    // Convert the hex data string to binary data
-    std::vector<char> binaryData;
-    for (std::size_t i = 0; i < hexData.length(); i += 2) {
-        std::string byteString = hexData.substr(i, 2);
-        char byte = static_cast<char>(std::stoi(byteString, nullptr, 16));
-        binaryData.push_back(byte);
-    }
-
     // Calculate the number of bytes to be replaced
     std::size_t bytesToReplace = binaryData.size();
 
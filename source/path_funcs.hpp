@@ -236,11 +236,12 @@ void copySingleFile(const std::string& fromFile, const std::string& toFile) {
     FILE* destFile = fopen(toFile.c_str(), "wb");
     if (srcFile && destFile) {
         const size_t bufferSize = 131072; // Increase buffer size to 128 KB
-        char buffer[bufferSize];
+        // Keep the buffer on the heap rather than the overlay thread's small stack
+        std::vector<char> buffer(bufferSize);
         size_t bytesRead;
 
-        while ((bytesRead = fread(buffer, 1, bufferSize, srcFile)) > 0) {
-            fwrite(buffer, 1, bytesRead, destFile);
+        while ((bytesRead = fread(buffer.data(), 1, bufferSize, srcFile)) > 0) {
+            fwrite(buffer.data(), 1, bytesRead, destFile);
         }
 
         fclose(srcFile);